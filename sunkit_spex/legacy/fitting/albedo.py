@@ -7,7 +7,7 @@ import numpy as np
 
 import astropy.units as u
 
-from sunkit_spex.models.physical.albedo import get_albedo_matrix as _get_albedo_matrix
+from sunkit_spex.models.physical.albedo import _check_energy_range, _get_albedo_matrix
 
 
 @u.quantity_input
@@ -15,8 +15,9 @@ def get_albedo_matrix(energy_edges: u.keV, theta: u.deg, anisotropy=1):
     r"""
     Get an albedo correction matrix.
 
-    Wraps `~sunkit_spex.models.physical.albedo.get_albedo_matrix`,
-    adding support for 2D energy edges.
+    Equivalent to `~sunkit_spex.models.physical.albedo.get_albedo_matrix`
+    but for 2D energy edges, flattening them and going straight to the
+    cached albedo matrix calculation.
 
     Parameters
     ----------
@@ -28,8 +29,10 @@ def get_albedo_matrix(energy_edges: u.keV, theta: u.deg, anisotropy=1):
         Ratio of the flux in observer direction to the flux downwards, 1 for an isotropic source
     """
     # The physical model Albedo matrix function expects 1D
-    # energy edges, so flatten the 2D edges from the legacy side,
-    # and just call the other function.
+    # energy edges, so flatten the 2D edges from the legacy side.
+    # This is called on every fit iteration so pass the keV edges
+    # straight to the cached matrix rather than back through a Quantity.
     energy_edges = energy_edges.to_value(u.keV)
-    flat_edges = np.concatenate((energy_edges[:, 0], [energy_edges[-1, -1]])) << u.keV
+    flat_edges = tuple(np.concatenate((energy_edges[:, 0], [energy_edges[-1, -1]])))
+    _check_energy_range(flat_edges)
     return _get_albedo_matrix(flat_edges, theta, anisotropy)
@@ -2,7 +2,11 @@
 The following code Handles how all data is loaded in from the individual instrument loaders and how the data is used (e.g., rebinning, etc.).
 """
 
-from copy import deepcopy
+import os
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import cached_property, lru_cache
 
 import numpy as np
 
@@ -18,6 +22,36 @@ from sunkit_spex.legacy.fitting.parameter_handler import (  # sunkit_spex.fittin
 __all__ = ["LoadSpec"]
 
 
+@lru_cache(maxsize=4096)
+def _telescope_for(pha_file, mtime_ns, size):
+    """Return the TELESCOP entry of a PHA file's primary header, None if it is not present.
+
+    The file modification time and size are part of the cache key so an edited file is read again.
+    """
+    with open(pha_file, "rb") as fh:
+        # anything that isn't a plain FITS file (e.g., gzipped) is left to astropy
+        if fh.read(6) != b"SIMPLE":
+            return fits.getheader(pha_file, ext=0).get("TELESCOP")
+        fh.seek(0)
+        # only the primary header's 2880 byte blocks of 80 character cards are needed, scanning them for the
+        # keyword avoids parsing every card in the header and setting up the HDU list
+        while len(block := fh.read(2880)) == 2880:
+            for c in range(0, 2880, 80):
+                card = block[c : c + 80]
+                if card.startswith(b"TELESCOP"):
+                    return fits.Card.fromstring(card.decode("ascii")).value
+                if card.startswith(b"END     "):
+                    return None
+    return None
+
+
+def _file_telescope(pha_file):
+    """Return the TELESCOP entry of a PHA file's primary header, None if it is not present."""
+    # headers are cached so re-loading the same files in a session doesn't re-read them
+    pha_stat = os.stat(pha_file)
+    return _telescope_for(os.path.abspath(pha_file), pha_stat.st_mtime_ns, pha_stat.st_size)
+
+
 class LoadSpec:
     """
     This class's job is to load in spectral file(s), obtain count spectra, and calculate/store the info for fitting.
@@ -96,8 +130,9 @@ class LoadSpec:
             All loaded spectral data.
 
 
-    _construction_string : string
-            String to be returned from __repr__() dunder method.
+    _construction_args : tuple
+            The inputs given to the class, used to build `_construction_string` (the string to be returned from
+            __repr__() dunder method) when it is first needed.
 
     _rebinned_edges : dict
             Dictionary of energy bins if they have been rebinned for each loaded spectrum. Set in rebin().
@@ -129,11 +164,17 @@ class LoadSpec:
         custom_channel_bins=None,
         **kwargs,
     ):
-        """Construct a string to show how the class was constructed (`_construction_string`) and set the `loaded_spec_data` dictionary attribute."""
-
-        self._construction_string = (
-            f"LoadSpec(*{args},pha_file={pha_file},arf_file={arf_file},rmf_file={rmf_file}"
-            f"srm_file={srm_file},srm_custom={srm_custom},custom_channel_bins={custom_channel_bins}, **{kwargs})"
+        """Keep the inputs for the string showing how the class was constructed (`_construction_string`) and set the `loaded_spec_data` dictionary attribute."""
+
+        self._construction_args = (
+            args,
+            pha_file,
+            arf_file,
+            rmf_file,
+            srm_file,
+            srm_custom,
+            custom_channel_bins,
+            kwargs,
         )
 
         self.instrument_loaders = {"NuSTAR": inst.NustarLoader, "RHESSI": rhessi.LegacyRhessiLoader, "Solar Orbiter": stix.STIXLoader}
@@ -150,17 +191,18 @@ class LoadSpec:
         num_of_files, num_of_custom = len(pha_file), len(args)
         self.loaded_spec_data, self.instruments = {}, {}
         for s in range(num_of_files + num_of_custom):
+            spec_key = f"spectrum{s + 1}"
             if s < num_of_custom:
                 # if a custom dict is given or if the user has set up the instrument loader class themselves and just wants to pass it straight in
-                if type(args[s]) == dict:
-                    self.loaded_spec_data[f"spectrum{s+1}"] = inst.CustomLoader(args[s], **kwargs)
-                    self.instruments[f"spectrum{s+1}"] = "CustomLoader"
+                if isinstance(args[s], dict):
+                    self.loaded_spec_data[spec_key] = inst.CustomLoader(args[s], **kwargs)
+                    self.instruments[spec_key] = "CustomLoader"
                 elif isinstance(args[s], inst.InstrumentBlueprint):
-                    self.loaded_spec_data[f"spectrum{s+1}"] = args[s]
-                    self.instruments[f"spectrum{s+1}"] = args[s].__class__.__name__
+                    self.loaded_spec_data[spec_key] = args[s]
+                    self.instruments[spec_key] = args[s].__class__.__name__
             else:
                 file_indx = s - num_of_custom
-                self.loaded_spec_data[f"spectrum{s+1}"] = self.instrument_loaders[instruments[s]](
+                self.loaded_spec_data[spec_key] = self.instrument_loaders[instruments[s]](
                     pha_file[file_indx],
                     arf_file=arf_file[file_indx],
                     rmf_file=rmf_file[file_indx],
@@ -169,7 +211,7 @@ class LoadSpec:
                     custom_channel_bins=custom_channel_bins[file_indx],
                     **kwargs,
                 )
-                self.instruments[f"spectrum{s+1}"] = instruments[s]
+                self.instruments[spec_key] = instruments[s]
 
         # Adding these classes should also yield {"spectrum1":..., "spectrum2":..., etc.}
 
@@ -205,7 +247,7 @@ class LoadSpec:
         arf_file, rmf_file, srm_custom, custom_channel_bins) along with a list of corresponding
         instrument names.
         """
-        if type(pha_file) == type(None):
+        if pha_file is None:
             return [], [], [], [], [], [], []
 
         # if only one observation is given then it won't be a list so make it one
@@ -215,29 +257,29 @@ class LoadSpec:
         file_srm = _make_into_list(srm_file)
 
         # the following should be numpy arrays so _make_into_list would turn the array to a list, not put it into a list
-        custom_srm = srm_custom if type(srm_custom) == list else [srm_custom]
-        custom_channel_bins = custom_channel_bins if type(custom_channel_bins) == list else [custom_channel_bins]
+        custom_srm = srm_custom if isinstance(srm_custom, list) else [srm_custom]
+        custom_channel_bins = custom_channel_bins if isinstance(custom_channel_bins, list) else [custom_channel_bins]
 
         # check if arf and rmf and custom srm is either None in which case everything is found via the pha
         #  file naming (a list of None the same length as the pha input will also achieve this) or if there
         #  is a corresponding arf, rmf, and srm for every pha file
         assert (
-            ((type(arf_file) == type(None)) and (type(arf_file) == type(None)) and (len(file_pha) >= 1))
+            ((arf_file is None) and (len(file_pha) >= 1))
             or ((len(file_arf) == len(file_pha)) and (len(file_rmf) == len(file_pha)))
         ), """Names can be taken from the \"pha_file\" input if your \"arf_file\", \"rmf_file\", and \"srm_file\" are not
                 supplied. This means that if your \"arf_file\", \"rmf_file\", and \"srm_file\" are supplied then they can
                 either be of list length==1 or the same number of entries as your \"pha_file\" input."""
 
         assert (
-            (type(file_srm) == type(None)) or (len(file_srm) == 1) or (len(file_srm) == len(file_pha))
+            (file_srm is None) or (len(file_srm) == 1) or (len(file_srm) == len(file_pha))
         ), """The \"file_srm\" should either be None, list length 1, or the same length as the \"pha_file\" input."""
 
         assert (
-            (type(srm_custom) == type(None)) or (len(custom_srm) == 1) or (len(custom_srm) == len(file_pha))
+            (srm_custom is None) or (len(custom_srm) == 1) or (len(custom_srm) == len(file_pha))
         ), """The \"srm_custom\" should either be None, list length 1, or the same length as the \"pha_file\" input."""
 
         assert (
-            (type(custom_channel_bins) == type(None))
+            (custom_channel_bins is None)
             or (len(custom_channel_bins) == 1)
             or (len(custom_channel_bins) == len(file_pha))
         ), """The \"custom_channel_bins\" should either be None, list length 1, or the same length as the \"pha_file\" input."""
@@ -288,14 +330,20 @@ class LoadSpec:
         -------
         List of corresponding instrument names (strings) to the input fits files.
         """
+        if len(pha_files) > 4:
+            # header reads are I/O bound so can be overlapped when there are a few files
+            with ThreadPoolExecutor(max_workers=min(8, len(pha_files))) as executor:
+                telescopes = list(executor.map(_file_telescope, pha_files))
+        else:
+            telescopes = [_file_telescope(pf) for pf in pha_files]
+
         _instruments_names = []
-        for pf in pha_files:
-            with fits.open(pf) as hdul:
-                if "TELESCOP" in hdul[0].header:
-                    # works for 'NuSTAR' and 'RHESSI'
-                    _instruments_names.append(hdul[0].header["TELESCOP"])
-                else:
-                    print("How do I know the instrument?")
+        for telescope in telescopes:
+            if telescope is not None:
+                # works for 'NuSTAR' and 'RHESSI'
+                _instruments_names.append(telescope)
+            else:
+                print("How do I know the instrument?")
         return _instruments_names
 
     @property
@@ -330,36 +378,37 @@ class LoadSpec:
         s.rebin = 10
         s.rebin = {"spectrum1":10}
         """
+        spec_keys = list(self.loaded_spec_data)
         # check what the setter has been given
         # if dict, can group all loaded spectral data differently, "all" key takes priority and is applied to all spectra
-        if type(group_mins) == dict:
+        if isinstance(group_mins, dict):
             if "all" in group_mins:
                 group_mins = group_mins["all"]
             else:
-                spec_list = list(self.loaded_spec_data.keys())
-                gms = [None] * len(spec_list)
-                for k in list(group_mins):
-                    if k in spec_list:
-                        gms[spec_list.index(k)] = group_mins[k]
+                spec_index = {spec: i for i, spec in enumerate(spec_keys)}
+                gms = [None] * len(spec_index)
+                for k, gm in group_mins.items():
+                    if k in spec_index:
+                        gms[spec_index[k]] = gm
                 group_mins = gms
         # if None: do nothing, if int:apply to all,
-        if type(group_mins) == type(None):
+        if group_mins is None:
             return None
-        elif type(group_mins) == int:
-            group_mins = [group_mins] * len(list(self.loaded_spec_data.keys()))
+        elif isinstance(group_mins, (int, np.integer)) and not isinstance(group_mins, bool):
+            group_mins = [group_mins] * len(spec_keys)
         elif not self._rebin_list_and_one2one(group_mins):
             return None
 
         # now rebin the data
         bin_edges = []
-        for s, c in zip(list(self.loaded_spec_data.keys()), group_mins):
+        for s, c in zip(spec_keys, group_mins):
             # should be able to rebin across photon and both axes too but not sure how user would set those yet
             bin_edges.append(self._rebin_loaded_spec(spectrum=s, group_min=c, axis="count"))
 
         # need to group response file stuff https://heasarc.gsfc.nasa.gov/xanadu/xspec/manual/node29.html
-        self._rebinned_edges = dict(zip(self.loaded_spec_data.keys(), bin_edges))
+        self._rebinned_edges = dict(zip(spec_keys, bin_edges))
         # remember how it was rebinned
-        self._rebin_setting = dict(zip(self.loaded_spec_data.keys(), group_mins))
+        self._rebin_setting = dict(zip(spec_keys, group_mins))
 
     def _rebin_effective_exposures(self, old_bins, new_bins, old_counts, new_counts, old_effective_exposures):
         """Rebin arrays of effective exposures.
@@ -403,7 +452,7 @@ class LoadSpec:
         -------
         Boolean.
         """
-        if (type(group_mins) in (list, np.ndarray)) and len(group_mins) == len(list(self.loaded_spec_data.keys())):
+        if isinstance(group_mins, (list, np.ndarray)) and len(group_mins) == len(self.loaded_spec_data):
             return True
         else:
             print(
@@ -437,10 +486,10 @@ class LoadSpec:
         if not hasattr(self, "_undo_rebin"):
             self._undo_rebin = "all"
 
-        if type(self._undo_rebin) == type(None):
+        if self._undo_rebin is None:
             return
 
-        spec_list = list(self.loaded_spec_data.keys()) if self._undo_rebin == "all" else self._undo_rebin
+        spec_list = list(self.loaded_spec_data) if self._undo_rebin == "all" else self._undo_rebin
 
         for spec in spec_list:
             _orig_in_extras = self._rebin_check(spectrum=spec)
@@ -448,11 +497,15 @@ class LoadSpec:
             if _orig_in_extras:
                 del self._rebin_setting[spec], self._rebinned_edges[spec]
                 # move original binning/counts/etc. into extras entry
-                for s_att in self.loaded_spec_data[spec]().keys():
+                spec_data = self.loaded_spec_data[spec]
+                extras = spec_data["extras"]
+                for s_att in spec_data().keys():
                     if s_att != "extras":
-                        self.loaded_spec_data[spec][s_att] = self.loaded_spec_data[spec]["extras"]["original_" + s_att]
-                        del self.loaded_spec_data[spec]["extras"]["original_" + s_att]
+                        spec_data[s_att] = extras.pop("original_" + s_att)
                 self._check_if_known_background_and_rebin(spectrum=spec, undo=True)
+            elif (spec in getattr(self, "_rebin_setting", {})) and (self._rebin_setting[spec] is None):
+                # rebinned with a None group minimum so the data was left alone, just forget the setting
+                del self._rebin_setting[spec], self._rebinned_edges[spec]
             else:
                 print(f"Nothing to undo in {spec} as data has not been rebinned.")
 
@@ -477,14 +530,18 @@ class LoadSpec:
         s.rebin = 10
         s.undo_rebin = \'all\' <equivalent to> s.undo_rebin
         """
-        if type(spectrum) == type(None):
+        if spectrum is None:
             self._undo_rebin = None
-        elif type(spectrum) == list:
-            specs_no = ["spectrum" + s for s in spectrum if isnumber(s)]
-            specs_id = [s.lower() for s in spectrum if (s.lower().startswith("spectrum"))]
+        elif isinstance(spectrum, list):
+            specs_no, specs_id = [], []
+            for s in spectrum:
+                if isnumber(s):
+                    specs_no.append(f"spectrum{s}")
+                elif s.lower().startswith("spectrum"):
+                    specs_id.append(s.lower())
             self._undo_rebin = specs_no + specs_id
         elif isnumber(spectrum):
-            self._undo_rebin = ["spectrum" + str(spectrum)]
+            self._undo_rebin = [f"spectrum{spectrum}"]
         elif spectrum.lower().startswith("spectrum"):
             self._undo_rebin = [spectrum.lower()]
         elif spectrum.lower() == "all":
@@ -492,7 +549,7 @@ class LoadSpec:
         else:
             self._undo_rebin = None
 
-        if (type(self._undo_rebin) == type(None)) or ((len(self._undo_rebin) == 0) and (self._undo_rebin != "all")):
+        if (self._undo_rebin is None) or ((len(self._undo_rebin) == 0) and (self._undo_rebin != "all")):
             print(
                 'Please provide the spectrum number (N or "N") indicated by spectrumN in loaded_spec_data attribute, the full spectrum identifier ("spectrumN"), or set to "all".'
             )
@@ -527,11 +584,13 @@ class LoadSpec:
         )
 
         # calculate the new widths, centres, count errors, count rates and count rate errors
-        new_binning = np.diff(new_bins).flatten()
-        bin_mids = np.mean(new_bins, axis=1)
-        ctr = (new_counts / new_binning) / new_effective_exposure
+        new_binning = new_bins[:, 1] - new_bins[:, 0]
+        bin_mids = (new_bins[:, 0] + new_bins[:, 1]) / 2
+        # counts and errors are converted to rates with the same factor so only work it out once
+        rate_norm = new_binning * new_effective_exposure
+        ctr = new_counts / rate_norm
         # old way the now ctr_err = (np.sqrt(new_counts) / new_binning) / new_effective_exposure
-        ctr_err = counts_error / new_binning / new_effective_exposure  # no guarantee always will have poisson errors
+        ctr_err = counts_error / rate_norm  # no guarantee always will have poisson errors
 
         return (
             new_bins,
@@ -564,6 +623,10 @@ class LoadSpec:
         New bin edges from the rebinning process.
         """
 
+        if (group_min is None) and (not self._rebin_check(spectrum=spectrum)):
+            # no grouping and no original binning to go back to so leave the data (and SRM) as they are
+            return self.loaded_spec_data[spectrum]["count_channel_bins"]
+
         if (axis == "count") or (axis == "photon_and_count"):
             (
                 new_bins,
@@ -577,36 +640,30 @@ class LoadSpec:
                 _orig_in_extras,
             ) = self._rebin_data(spectrum, group_min)
 
+        spec = self.loaded_spec_data[spectrum]
         if not _orig_in_extras:
             # move original binning/counts/etc. into extras entry
-            for s_att in self.loaded_spec_data[spectrum]().keys():
+            extras = spec["extras"]
+            for s_att in spec().keys():
                 if s_att != "extras":
                     # print("putting in extras", s_att)
-                    self.loaded_spec_data[spectrum]["extras"]["original_" + s_att] = self.loaded_spec_data[spectrum][
-                        s_att
-                    ]
+                    extras["original_" + s_att] = spec[s_att]
 
         # put new rebinned data into the loaded_spec_data dictionary
         if (axis == "count") or (axis == "photon_and_count"):
-            self.loaded_spec_data[spectrum]["count_channel_bins"] = new_bins
-            self.loaded_spec_data[spectrum]["count_channel_mids"] = bin_mids
-            self.loaded_spec_data[spectrum]["count_channel_binning"] = new_binning
+            spec["count_channel_bins"] = new_bins
+            spec["count_channel_mids"] = bin_mids
+            spec["count_channel_binning"] = new_binning
         if (axis == "photon") or (axis == "photon_and_count"):
-            self.loaded_spec_data[spectrum]["photon_channel_bins"] = new_bins
-            self.loaded_spec_data[spectrum]["photon_channel_mids"] = bin_mids
-            self.loaded_spec_data[spectrum]["photon_channel_binning"] = new_binning
-        self.loaded_spec_data[spectrum]["counts"] = new_counts
-        self.loaded_spec_data[spectrum]["count_rate"] = ctr
-        self.loaded_spec_data[spectrum]["count_rate_error"] = ctr_err
-        self.loaded_spec_data[spectrum]["effective_exposure"] = new_effective_exposure
-
-        # update the count errors
-        self.loaded_spec_data[spectrum]["count_error"] = count_error
-        self.loaded_spec_data[spectrum]["count_rate_error"] = (
-            self.loaded_spec_data[spectrum]["count_error"]
-            / self.loaded_spec_data[spectrum]["effective_exposure"]
-            / self.loaded_spec_data[spectrum]["count_channel_binning"]
-        )
+            spec["photon_channel_bins"] = new_bins
+            spec["photon_channel_mids"] = bin_mids
+            spec["photon_channel_binning"] = new_binning
+        spec["counts"] = new_counts
+        spec["count_rate"] = ctr
+        # count rate errors were already worked out from these count errors in _rebin_data
+        spec["count_error"] = count_error
+        spec["count_rate_error"] = ctr_err
+        spec["effective_exposure"] = new_effective_exposure
 
         # if spec has a known background, (e.g.,RHESSI) then have it here
         self._check_if_known_background_and_rebin(spectrum, new_bins)
@@ -618,7 +675,7 @@ class LoadSpec:
         # the rebinning I think XSPEC uses internally https://heasarc.gsfc.nasa.gov/lheasoft/ftools/headas/ftrbnrmf.html
         # good website for XSPEC commands https://heasarc.gsfc.nasa.gov/lheasoft/ftools/headas/heasptools.html
         # self.loaded_spec_data[spectrum]["srm"] = self._rebin_srm(spectrum=spectrum, axis="count")
-        self.loaded_spec_data[spectrum]["srm"] = self.loaded_spec_data[spectrum]._rebin_srm(axis="count")
+        spec["srm"] = spec._rebin_srm(axis="count")
         return new_bins
 
     def _check_if_known_background_and_rebin(self, spectrum, new_bins=None, undo=False):
@@ -717,29 +774,73 @@ class LoadSpec:
         -------
         The number of counts left over at the end that could not be grouped into the minimum number and new bins/counts arrays.
         """
-        binned_channel = []
-        binned_counts = []
-        combin = 0
-        reset_bin_counter = True
-        for c, count in enumerate(counts):
-            if count >= group_min and combin == 0 and reset_bin_counter:
-                binned_channel.append(channel_bins[c])
-                binned_counts.append(count)
-            else:
-                if reset_bin_counter:
-                    start_e_bin = channel_bins[c][0]
-                    reset_bin_counter = False
+        channel_bins, counts = np.asarray(channel_bins), np.asarray(counts)
+        # a group closes as soon as its running total reaches group_min
+        if (not np.issubdtype(counts.dtype, np.integer)) or (len(counts) > 0 and counts.min() < 0):
+            # background subtracted counts can be negative and differences of a cumulative sum of non-integer
+            # counts can round differently to the running total, so step through them keeping the running total
+            group_ends, binned_counts, combin = [], [], 0
+            for c, count in enumerate(counts.tolist()):
                 combin += count
                 if combin >= group_min:
-                    binned_channel.append(
-                        [start_e_bin, channel_bins[c][1]]
-                    )  # starting at the last bin edge and the last edge of the bin we're on
+                    group_ends.append(c)
                     binned_counts.append(combin)
                     combin = 0
-                    reset_bin_counter = True
+            binned_counts = np.array(binned_counts, dtype=counts.dtype)
+        else:
+            group_ends, combin = self._group_ends_non_negative(counts, group_min)
+            binned_counts = None
+
+        group_ends = np.array(group_ends, dtype=int)
+        group_starts = np.concatenate(([0], group_ends[:-1] + 1))[: len(group_ends)]
+        binned_channel = np.column_stack((channel_bins[group_starts, 0], channel_bins[group_ends, 1]))
+        if binned_counts is None:
+            # integer sums are exact so can be taken over the groups in one go
+            binned_counts = (
+                np.add.reduceat(counts[: group_ends[-1] + 1], group_starts) if len(group_ends) > 0 else counts[:0]
+            )
 
         return combin, binned_channel, binned_counts
 
+    @staticmethod
+    def _group_ends_non_negative(counts, group_min):
+        """Finds the last bin of each group for non-negative integer counts.
+
+        Parameters
+        ----------
+        counts : np.array
+                Integer array of the counts, none of which are negative.
+
+        group_min : Int
+                The minimum number of counts allowed in a bin.
+
+        Returns
+        -------
+        List of the index of the last bin in each group and the number of counts left over at the end.
+        """
+        # with the (non-decreasing) cumulative sum each group's last bin is found with a binary search instead of
+        # stepping through the counts one at a time
+        cumulative_counts = np.cumsum(counts).tolist()
+        # runs of bins that can form a group on their own are taken in one go (with an end of array sentinel)
+        low_bins = np.flatnonzero(counts < group_min).tolist() + [len(counts)]
+
+        group_ends = []
+        start, counts_before_start = 0, 0
+        while start < len(counts):
+            next_low = low_bins[bisect_left(low_bins, start)]
+            if next_low > start:
+                group_ends.extend(range(start, next_low))
+                start, counts_before_start = next_low, cumulative_counts[next_low - 1]
+                continue
+            end = bisect_left(cumulative_counts, counts_before_start + group_min, lo=start)
+            if end == len(counts):
+                break
+            group_ends.append(end)
+            start, counts_before_start = end + 1, cumulative_counts[end]
+
+        combin = cumulative_counts[-1] - counts_before_start if len(counts) > 0 else 0
+        return group_ends, combin
+
     def group_pha_finder(self, channels, counts, group_min=None, print_tries=False):
         """Takes the counts, and checks the bins left over from grouping the bins with a minimum value.
 
@@ -814,26 +915,13 @@ class LoadSpec:
         Any bins left over are now included with zero counts.
         """
 
-        counts = (
-            self.loaded_spec_data[spectrum]["counts"]
-            if not _orig_in_extras
-            else self.loaded_spec_data[spectrum]["extras"]["original_counts"]
-        )
-        count_error = (
-            self.loaded_spec_data[spectrum]["count_error"]
-            if not _orig_in_extras
-            else self.loaded_spec_data[spectrum]["extras"]["original_count_error"]
-        )
-        channel_bins = (
-            self.loaded_spec_data[spectrum]["count_channel_bins"]
-            if not _orig_in_extras
-            else self.loaded_spec_data[spectrum]["extras"]["original_count_channel_bins"]
-        )
-        old_effective_exposures = (
-            self.loaded_spec_data[spectrum]["effective_exposure"]
-            if not _orig_in_extras
-            else self.loaded_spec_data[spectrum]["extras"]["original_effective_exposure"]
-        )
+        # take the data from the original entries in extras if the spectrum has already been rebinned
+        spec = self.loaded_spec_data[spectrum]
+        source, prefix = (spec["extras"], "original_") if _orig_in_extras else (spec, "")
+        counts = source[prefix + "counts"]
+        count_error = source[prefix + "count_error"]
+        channel_bins = source[prefix + "count_channel_bins"]
+        old_effective_exposures = source[prefix + "effective_exposure"]
 
         new_bins, new_counts = self._group_cts(channel_bins, counts, group_min=group_min, spectrum=spectrum)
         new_effective_exposure = self._rebin_effective_exposures(
@@ -883,11 +971,11 @@ class LoadSpec:
 
         # since SRM is going to be binned, add the rest of the photon bins on at the end with native binning
         # any counts in these bins will be ignored, only 0s taken into consideration in photon space for these
-        remainder_bins = channel_bins[np.where(channel_bins[:, 1] > np.array(binned_channel)[-1, -1])]
+        # the channel bins are ascending so the remaining bins are everything after the last grouped edge
+        remainder_bins = channel_bins[np.searchsorted(channel_bins[:, 1], binned_channel[-1, -1], side="right") :]
 
-        binned_counts += [0] * len(remainder_bins)
-        new_bins = np.concatenate((np.array(binned_channel), remainder_bins))
-        new_counts = np.array(binned_counts)
+        new_bins = np.concatenate((binned_channel, remainder_bins))
+        new_counts = np.concatenate((binned_counts, np.zeros(len(remainder_bins), dtype=binned_counts.dtype)))
 
         self._verbose_tries(spectrum, group_min, combin, verbose)
 
@@ -905,8 +993,8 @@ class LoadSpec:
         -------
         Boolean.
         """
-        if type(group_min) != int or group_min <= 0:
-            if type(group_min) == type(None):
+        if not isinstance(group_min, (int, np.integer)) or isinstance(group_min, bool) or group_min <= 0:
+            if group_min is None:
                 return False
             print("The 'group_min' parameter must be an integer > 0.")
             return False
@@ -937,7 +1025,7 @@ class LoadSpec:
         None.
         """
         if combin > 0 and verbose:
-            if type(spectrum) != type(None):
+            if spectrum is not None:
                 print("In " + spectrum + ", ", end="")
             print(
                 combin,
@@ -950,20 +1038,35 @@ class LoadSpec:
         Just combine other's loaded_spec_data with self's while changing other's spectrum numbers. E.g.,
         self.loaded_spec_data={"spectrum1":...}, other.loaded_spec_data={"spectrum1":...}, then
         (self+other).loaded_spec_data={"spectrum1":...,"spectrum2":...}"spectrum2" was other's "spectrum1"
+
+        The result holds the same spectrum loaders as self and other rather than copies (changing the data of one
+        changes it in the other), use `copy.deepcopy` on the result if an independent object is needed.
         """
 
         # combine loaded_spec_data attribute between classes
         # can't just do a = {**b, **c} since keys need to change in the second dict
         _other_spec_ = list(other.loaded_spec_data.keys())
-        _last_in_self_ = int(list(self.loaded_spec_data.keys())[-1].split("spectrum")[-1])
+        _last_in_self_ = int(next(reversed(self.loaded_spec_data)).split("spectrum")[-1])
 
-        # combine the loaded_spec_data dicts
-        new_self = deepcopy(self)
+        # only the dicts being added to need to be new, the loaders (and their SRMs, etc.) can be shared
+        new_self = copy(self)
+        new_self.loaded_spec_data, new_self.instruments = dict(self.loaded_spec_data), dict(self.instruments)
         for c, key_other in enumerate(_other_spec_):
-            new_self.loaded_spec_data["spectrum" + str(_last_in_self_ + 1 + c)] = other.loaded_spec_data[key_other]
+            new_key = f"spectrum{_last_in_self_ + 1 + c}"
+            new_self.loaded_spec_data[new_key] = other.loaded_spec_data[key_other]
+            new_self.instruments[new_key] = other.instruments[key_other]
 
         return new_self
 
+    @cached_property
+    def _construction_string(self):
+        """String to be returned from __repr__(), only formatted (arrays and all) when it is asked for."""
+        args, pha_file, arf_file, rmf_file, srm_file, srm_custom, custom_channel_bins, kwargs = self._construction_args
+        return (
+            f"LoadSpec(*{args},pha_file={pha_file},arf_file={arf_file},rmf_file={rmf_file},"
+            f"srm_file={srm_file},srm_custom={srm_custom},custom_channel_bins={custom_channel_bins}, **{kwargs})"
+        )
+
     def __repr__(self):
         """Provide a representation to construct the class from scratch."""
         return self._construction_string
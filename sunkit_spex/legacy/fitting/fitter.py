@@ -1672,15 +1672,6 @@ class Fitter:
         """
         return LL_CLASS.log_likelihoods[self.loglikelihood.lower()]
 
-    def _minus_2lnL(self):
-        """Return -2*log_likelihood for a minimiser.
-
-        Returns
-        -------
-        Lambda function.
-        """
-        return lambda *args: -2 * self._choose_loglikelihood()(*args)
-
     def _update_tied(self, table):
         """Updates the tied parameter values in the given parameter table.
 
@@ -1811,18 +1802,19 @@ class Fitter:
             **kwargs,
         )
 
+        if maximize_or_minimize not in ("maximize", "minimize"):
+            return 0
+
+        # look up the likelihood function once rather than for every spectrum
+        loglikelihood = self._choose_loglikelihood()
         ll = 0
         for m, o, l, err in zip(mu, observed_counts, livetime, observed_count_errors):
             # calculate the count rate model for each spectrum
             model_cts = self._count_rate2count(m, l)
+            ll += loglikelihood(model_cts, o, err)
 
-            # either calculate ln(L) or -2ln(L)
-            if maximize_or_minimize == "maximize":
-                ll += self._choose_loglikelihood()(model_cts, o, err)
-            elif maximize_or_minimize == "minimize":
-                ll += self._minus_2lnL()(model_cts, o, err)
-
-        return ll
+        # either return ln(L) or -2ln(L)
+        return ll if maximize_or_minimize == "maximize" else -2 * ll
 
     def _cut_srm(self, srms, spectrum=None):
         """Select the columns in the SRM (count space) that are appropriate for the defined fitting range.
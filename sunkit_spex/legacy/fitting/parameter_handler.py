@@ -600,6 +600,12 @@ def isnumber(word):
     -------
     Boolean.
     """
+    # settle the common string cases (e.g., "10" or "spectrum1") without relying on float() raising
+    if isinstance(word, str):
+        if word.isascii() and word.isdigit():
+            return True
+        if word.isidentifier() and word.lower() not in ("inf", "infinity", "nan"):
+            return False
     try:
         float(word)
     except (ValueError, TypeError):
@@ -0,0 +1,157 @@
+import numpy as np
+
+from astropy.io import fits
+
+from sunkit_spex.legacy.fitting.data_loader import LoadSpec, _telescope_for
+
+
+def _write_pha(path, telescope=None, n_extra_cards=0):
+    hdr = fits.Header()
+    for c in range(n_extra_cards):
+        hdr[f"EXTRA{c}"] = c
+    if telescope is not None:
+        hdr["TELESCOP"] = telescope
+    fits.HDUList([fits.PrimaryHDU(header=hdr), fits.ImageHDU(np.zeros(3))]).writeto(path)
+    return str(path)
+
+
+def test_files2instruments(tmp_path):
+    nustar = _write_pha(tmp_path / "nu.pha", telescope="NuSTAR")
+    rhessi = _write_pha(tmp_path / "hsi.pha", telescope="RHESSI")
+    assert LoadSpec()._files2instruments([nustar, rhessi, nustar]) == ["NuSTAR", "RHESSI", "NuSTAR"]
+
+
+def test_files2instruments_long_or_compressed_header(tmp_path):
+    # keyword past the first header block
+    nustar = _write_pha(tmp_path / "nu.pha", telescope="NuSTAR", n_extra_cards=50)
+    rhessi = _write_pha(tmp_path / "hsi.pha.gz", telescope="RHESSI")
+    assert LoadSpec()._files2instruments([nustar, rhessi]) == ["NuSTAR", "RHESSI"]
+
+
+def test_files2instruments_no_telescope(tmp_path, capsys):
+    unknown = _write_pha(tmp_path / "unknown.pha")
+    assert LoadSpec()._files2instruments([unknown]) == []
+    assert "How do I know the instrument?" in capsys.readouterr().out
+
+
+def test_files2instruments_cached(tmp_path):
+    _telescope_for.cache_clear()
+    pha = _write_pha(tmp_path / "spec.pha", telescope="NuSTAR")
+    LoadSpec()._files2instruments([pha])
+    LoadSpec()._files2instruments([pha])
+    assert _telescope_for.cache_info().hits == 1
+
+    # a changed file is read again, the extra cards push the header into another block so the size changes
+    (tmp_path / "spec.pha").unlink()
+    _write_pha(tmp_path / "spec.pha", telescope="RHESSI", n_extra_cards=40)
+    assert LoadSpec()._files2instruments([pha]) == ["RHESSI"]
+    assert _telescope_for.cache_info().misses == 2
+
+
+def test_group():
+    channel_bins = np.column_stack((np.arange(8), np.arange(1, 9)))
+    counts = np.array([5, 1, 1, 3, 0, 6, 2, 1])
+    combin, binned_channel, binned_counts = LoadSpec().group(channel_bins, counts, group_min=4)
+    assert combin == 3
+    np.testing.assert_array_equal(binned_channel, [[0, 1], [1, 4], [4, 6]])
+    np.testing.assert_array_equal(binned_counts, [5, 5, 6])
+
+
+def test_group_negative_counts():
+    # background subtracted counts can be negative
+    channel_bins = np.column_stack((np.arange(11), np.arange(1, 12)))
+    counts = np.array([2, 4, 4, 5, 5, -3, 0, -2, 7, 5, 2])
+    combin, binned_channel, binned_counts = LoadSpec().group(channel_bins, counts, group_min=8)
+    assert combin == 0
+    np.testing.assert_array_equal(binned_channel, [[0, 3], [3, 5], [5, 11]])
+    np.testing.assert_array_equal(binned_counts, [10, 10, 9])
+
+
+def test_group_float_counts():
+    # e.g., counts from rates, live times and durations
+    channel_bins = np.column_stack((np.arange(4), np.arange(1, 5)))
+    counts = np.array([0.7, 0.7, 0.7, 0.3])
+    combin, binned_channel, binned_counts = LoadSpec().group(channel_bins, counts, group_min=1)
+    assert combin == 0
+    np.testing.assert_array_equal(binned_channel, [[0, 2], [2, 4]])
+    np.testing.assert_array_equal(binned_counts, [0.7 + 0.7, 0.7 + 0.3])
+
+    # nothing should be left over so the first group minimum tried is the one that works
+    binned_channel, group_min = LoadSpec().group_pha_finder(channel_bins, counts, group_min=1)
+    assert group_min == 1
+    np.testing.assert_array_equal(binned_channel, [[0, 2], [2, 4]])
+
+
+def _custom_spec():
+    counts = np.array([5.0, 1, 1, 3])
+    return {
+        "count_channel_bins": np.column_stack((np.arange(4), np.arange(1, 5))),
+        "counts": counts,
+        "count_error": np.sqrt(counts),
+        "effective_exposure": 1,
+        "srm": np.identity(4),
+    }
+
+
+def test_add():
+    spec = _custom_spec()
+    first, second = LoadSpec(spec), LoadSpec(spec, spec)
+    added = first + second
+    assert list(added.loaded_spec_data) == ["spectrum1", "spectrum2", "spectrum3"]
+    assert list(added.instruments) == ["spectrum1", "spectrum2", "spectrum3"]
+    assert added.loaded_spec_data["spectrum1"] is first.loaded_spec_data["spectrum1"]
+    assert added.loaded_spec_data["spectrum3"] is second.loaded_spec_data["spectrum2"]
+    assert list(first.loaded_spec_data) == ["spectrum1"]
+
+
+def test_rebin_numpy_integer():
+    spec = LoadSpec(_custom_spec())
+    spec.rebin = np.int64(4)
+    np.testing.assert_array_equal(spec.rebin["spectrum1"], [[0, 1], [1, 4]])
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum1"]["counts"], [5, 5])
+
+
+def test_rebin_bool_rejected():
+    spec = LoadSpec(_custom_spec())
+    spec.rebin = True
+    assert spec.rebin is None
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum1"]["counts"], [5, 1, 1, 3])
+    assert not spec._valid_group_min_entry(True)
+
+
+def test_undo_rebin_spectrum_ids():
+    spec = LoadSpec(_custom_spec(), _custom_spec(), _custom_spec())
+    spec.rebin = 4
+    spec.undo_rebin = ["1", "Spectrum3", "all"]
+    assert spec._undo_rebin == ["spectrum1", "spectrum3"]
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum1"]["counts"], [5, 1, 1, 3])
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum2"]["counts"], [5, 5])
+
+
+def test_repr():
+    assert repr(LoadSpec(pha_file=None)) == (
+        "LoadSpec(*(),pha_file=None,arf_file=None,rmf_file=None,srm_file=None,srm_custom=None,"
+        "custom_channel_bins=None, **{})"
+    )
+
+
+def test_files2instruments_many(tmp_path):
+    telescopes = ["NuSTAR", "RHESSI", "NuSTAR", "RHESSI", "RHESSI", "NuSTAR"]
+    phas = [_write_pha(tmp_path / f"spec{c}.pha", telescope=t) for c, t in enumerate(telescopes)]
+    assert LoadSpec()._files2instruments(phas) == telescopes
+
+
+def test_rebin_none_leaves_spectrum(capsys):
+    spec = LoadSpec(_custom_spec(), _custom_spec())
+    srm = spec.loaded_spec_data["spectrum1"]["srm"]
+    spec.rebin = [None, 4]
+    assert spec.loaded_spec_data["spectrum1"]["srm"] is srm
+    assert "original_srm" not in spec.loaded_spec_data["spectrum1"]["extras"]
+    np.testing.assert_array_equal(spec.rebin["spectrum1"], _custom_spec()["count_channel_bins"])
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum2"]["counts"], [5, 5])
+
+    spec.undo_rebin = "all"
+    assert "Nothing to undo" not in capsys.readouterr().out
+    assert spec.rebin == {}
+    assert spec._rebin_setting == {}
+    np.testing.assert_array_equal(spec.loaded_spec_data["spectrum2"]["counts"], [5, 1, 1, 3])
@@ -93,11 +93,24 @@ class Albedo(FittableModel):
 
         super().__init__(*args, **kwargs)
 
+    @property
+    def energy_edges(self):
+        return self._energy_edges
+
+    @energy_edges.setter
+    @u.quantity_input
+    def energy_edges(self, energy_edges: Quantity[u.keV]):
+        # Validated and converted once here so each evaluation can go straight to the cached matrix
+        energy_edges_keV = tuple(energy_edges.to_value(u.keV))
+        _check_energy_range(energy_edges_keV)
+        self._energy_edges = energy_edges
+        self._energy_edges_keV = energy_edges_keV
+
     def evaluate(self, spectrum, theta, anisotropy):
         if not isinstance(theta, Quantity):
             theta = theta * u.deg
 
-        albedo_matrix = get_albedo_matrix(self.energy_edges, theta, anisotropy)
+        albedo_matrix = _get_albedo_matrix(self._energy_edges_keV, theta, anisotropy)
 
         return spectrum + spectrum @ albedo_matrix
 
@@ -178,7 +191,9 @@ def _calculate_albedo_matrix(energy_edges: tuple[float], theta: float, anisotrop
         Ratio of the flux in observer direction to the flux downwards, 1 for an isotropic source
     """
     albedo_interpolator = _get_green_matrix(theta)
-    de = np.diff(energy_edges)
+    # Edges arrive as a tuple (for the cache key) so only convert them to an array once
+    energy_edges = np.asarray(energy_edges)
+    de = energy_edges[1:] - energy_edges[:-1]
     energy_centers = energy_edges[:-1] + de / 2
 
     X, Y = np.meshgrid(energy_centers, energy_centers)
@@ -188,8 +203,10 @@ def _calculate_albedo_matrix(energy_edges: tuple[float], theta: float, anisotrop
     # Scale by anisotropy
     albedo_interp = (albedo_interp * de) / anisotropy
 
-    # Take a transpose
-    return albedo_interp.T
+    # Take a transpose, made read-only since the cache hands the same array to every caller
+    albedo_matrix = albedo_interp.T
+    albedo_matrix.flags.writeable = False
+    return albedo_matrix
 
 
 @u.quantity_input
@@ -222,11 +239,29 @@ def get_albedo_matrix(energy_edges: Quantity[u.keV], theta: Quantity[u.deg], ani
            [5.22059171e-01, 3.02951100e-01, 1.46291699e-13, 0.00000000e+00],
            [4.52582540e-01, 3.69821128e-01, 1.13435321e-01, 5.95953019e-15]])
     """
-    if energy_edges[0].to_value(u.keV) < 3 or energy_edges[-1].to_value(u.keV) > 600:
+    energy_edges_keV = tuple(energy_edges.to_value(u.keV))
+    _check_energy_range(energy_edges_keV)
+
+    return _get_albedo_matrix(energy_edges_keV, theta, anisotropy)
+
+
+def _check_energy_range(energy_edges_keV: tuple[float]):
+    r"""
+    Check energy edges already converted to keV are within the 3 to 600 keV range of the Green's function data.
+    """
+    if energy_edges_keV[0] < 3 or energy_edges_keV[-1] > 600:
         raise ValueError("Supported energy range 3 <= E <= 600 keV")
+
+
+def _get_albedo_matrix(energy_edges_keV: tuple[float], theta: Quantity, anisotropy) -> NDArray:
+    r"""
+    Get albedo correction matrix for energy edges already converted to keV.
+
+    Skips the unit handling of `get_albedo_matrix` so models can call it on every evaluation.
+    """
     theta = np.array(theta).squeeze() << theta.unit
     if np.abs(theta) > 90 * u.deg:
         raise ValueError(f"Theta must be between -90 and 90 degrees: {theta}.")
     anisotropy = np.array(anisotropy).squeeze()
 
-    return _calculate_albedo_matrix(tuple(energy_edges.to_value(u.keV)), theta.to_value(u.deg), anisotropy.item())
+    return _calculate_albedo_matrix(energy_edges_keV, theta.to_value(u.deg), anisotropy.item())
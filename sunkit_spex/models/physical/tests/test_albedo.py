@@ -18,6 +18,14 @@ def test_get_albedo_matrix():
     assert albedo_matrix[-1, -1] == 2.3302891436400413e-27
 
 
+def test_get_albedo_matrix_read_only():
+    e = [4, 10, 20] * u.keV
+    albedo_matrix = get_albedo_matrix(e, theta=0 * u.deg)
+    with pytest.raises(ValueError, match=r".*read-only.*"):
+        albedo_matrix[0, 0] = 1
+    assert get_albedo_matrix(e, theta=0 * u.deg) is albedo_matrix
+
+
 def test_get_albedo_matrix_bad_energy():
     e = [1, 4, 10, 20] * u.keV
     with pytest.raises(ValueError, match=r"Supported energy range 3.*"):
@@ -32,6 +40,21 @@ def test_get_albedo_matrix_bad_angle():
         get_albedo_matrix(e, theta=-91 * u.deg)
 
 
+def test_albedo_energy_edges():
+    with pytest.raises(ValueError, match=r"Supported energy range 3.*"):
+        Albedo(energy_edges=[1, 4, 10] * u.keV)
+    with pytest.raises(UnitsError, match=r".*Argument 'energy_edges'.*'keV'."):
+        Albedo(energy_edges=[4, 10, 20] * u.m)
+
+    albedo = Albedo(energy_edges=[4, 10, 20] * u.keV)
+    albedo.energy_edges = [5, 50, 500] * u.keV
+    assert albedo._energy_edges_keV == (5, 50, 500)
+    albedo.energy_edges = [0.01, 0.1] * u.MeV
+    assert_allclose(albedo._energy_edges_keV, (10, 100))
+    with pytest.raises(ValueError, match=r"Supported energy range 3.*"):
+        albedo.energy_edges = [10, 700] * u.keV
+
+
 def test_albedo_model():
     e_edges = np.linspace(10, 300, 10) * u.keV
     e_centers = e_edges[0:-1] + (0.5 * np.diff(e_edges))
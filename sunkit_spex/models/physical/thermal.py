@@ -685,7 +685,6 @@ LINE_GRID = setup_line_parameters()
 DEFAULT_ABUNDANCES = setup_default_abundances()
 
 
-@u.quantity_input
 def continuum_emission(
     energy_edges,
     temperature,
@@ -732,7 +731,6 @@ def continuum_emission(
     return flux
 
 
-@u.quantity_input
 def line_emission(
     energy_edges,
     temperature,
@@ -12,9 +12,6 @@ __all__ = ["SpectralAxis", "Spectrum", "gwcs_from_array"]
 __doctest_requires__ = {"Spectrum": ["ndcube>=2.3"]}
 
 
-__doctest_requires__ = {"Spectrum": ["ndcube>=2.3"]}
-
-
 def gwcs_from_array(array):
     """
     Create a new WCS from provided tabular data. This defaults to being
@@ -46,9 +43,6 @@ def gwcs_from_array(array):
 
     return SpectralGWCS(forward_transform=forward_transform, input_frame=coord_frame, output_frame=spec_frame)
 
-    # Store the intended unit from the origin input array
-    #     tabular_gwcs._input_unit = orig_array.unit
-
 
 class SpectralAxis(SpectralCoord):
     """
@@ -191,15 +185,12 @@ class Spectrum(NDCube):
         # If flux and spectral axis are both specified, check that their lengths
         # match or are off by one (implying the spectral axis stores bin edges)
         if data is not None and spectral_axis is not None:
-            if spectral_axis.shape[0] == data.shape[spectral_dimension]:
-                bin_specification = "centers"
-            elif spectral_axis.shape[0] == data.shape[spectral_dimension] + 1:
-                bin_specification = "edges"
-            else:
+            n_axis, n_data = spectral_axis.shape[0], data.shape[spectral_dimension]
+            if n_axis - n_data not in (0, 1):
                 raise ValueError(
-                    f"Spectral axis length ({spectral_axis.shape[0]}) must be the same size or one "
-                    "greater (if specifying bin edges) than that of the spextral"
-                    f"axis ({data.shape[spectral_dimension]})"
+                    f"Spectral axis length ({n_axis}) must be the same size or one "
+                    "greater (if specifying bin edges) than that of the spectral "
+                    f"axis ({n_data})"
                 )
 
         # Attempt to parse the spectral axis. If none is given, try instead to
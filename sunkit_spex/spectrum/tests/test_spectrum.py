@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 import astropy.units as u
@@ -14,3 +15,8 @@ def test_spectrum_bin_edges():
 def test_spectrum_bin_centers():
     spec = Spectrum(np.arange(1, 11) * u.watt, spectral_axis=(np.arange(1, 11) - 0.5) * u.keV)
     assert_array_equal(spec._spectral_axis, [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5] * u.keV)
+
+
+def test_spectrum_bad_spectral_axis_length():
+    with pytest.raises(ValueError, match=r"Spectral axis length \(13\) .* spectral axis \(10\)"):
+        Spectrum(np.arange(1, 11) * u.watt, spectral_axis=np.arange(1, 14) * u.keV)